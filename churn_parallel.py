@@ -0,0 +1,166 @@
+"""
+Process-pool workers for Proactive_Churn_Prevention.ipynb.
+
+Pools use the "spawn" start method: the notebook kernel runs threads
+(TOOL_EXECUTOR, OpenTelemetry readers), and forking a threaded process can
+deadlock. Spawned workers cannot see functions defined in notebook cells, so
+everything they run lives here, importable by name, and receives its inputs
+(CONFIG values, data) explicitly.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Synthetic customer distributions, shared by the notebook's serial
+# generate_customer_data and the chunked generator below.
+SUBSCRIPTION_TIERS = np.array(['Basic', 'Standard', 'Premium', 'Enterprise'])
+SUBSCRIPTION_TIER_P = [0.30, 0.35, 0.25, 0.10]
+TIER_BASE_CHARGE = np.array([29.0, 79.0, 149.0, 299.0])
+NPS_P = [0.02, 0.02, 0.03, 0.05, 0.08, 0.10, 0.15, 0.20, 0.18, 0.12, 0.05]
+LOGIN_FREQUENCY_LAM = 15
+
+
+def process_pool(workers: int, initializer=None, initargs: Tuple = ()) -> ProcessPoolExecutor:
+    """Process pool with spawn-started workers (safe from a threaded parent)."""
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                               initializer=initializer, initargs=initargs)
+
+
+def customer_ids_from_keys(keys: np.ndarray) -> np.ndarray:
+    """Render integer customer keys as CUST_000001-style ids (vectorized)."""
+    return np.char.add('CUST_', np.char.zfill(np.asarray(keys).astype(str), 6))
+
+
+def _chunk_streams(seed_seq: np.random.SeedSequence) -> Tuple[np.random.SeedSequence, np.random.SeedSequence]:
+    """
+    (login_frequency, other columns) seed streams of a chunk.
+
+    Same children as a fresh seed_seq.spawn(2), but derived without advancing
+    seed_seq's spawn counter, so a chunk's seed can be reused (login pre-pass,
+    then generation) and always yields the same columns.
+    """
+    login_ss, rest_ss = (np.random.SeedSequence(seed_seq.entropy, spawn_key=seed_seq.spawn_key + (i,),
+                                                pool_size=seed_seq.pool_size) for i in range(2))
+    return login_ss, rest_ss
+
+
+def generate_login_frequency(seed_seq: np.random.SeedSequence, size: int) -> np.ndarray:
+    """A chunk's login_frequency_monthly column (its own stream, see _chunk_streams)."""
+    login_ss, _ = _chunk_streams(seed_seq)
+    return np.random.default_rng(login_ss).poisson(lam=LOGIN_FREQUENCY_LAM, size=size)
+
+
+def generate_customer_chunk(first_key: int, size: int, seed_seq: np.random.SeedSequence,
+                            label_weights: Dict[str, float], noise_sigma: float,
+                            string_ids: bool = False) -> pd.DataFrame:
+    """
+    Generate one chunk of synthetic customers.
+
+    Parameters
+    ----------
+    first_key : int
+        Integer key of the first customer in the chunk.
+    size : int
+        Number of customers.
+    seed_seq : np.random.SeedSequence
+        The chunk's seed stream.
+    label_weights, noise_sigma
+        CONFIG["synthetic_label"] weights and noise of the churn label model.
+    string_ids : bool
+        Emit CUST_xxxxxx strings; by default `customer_id` is the compact int64 key.
+    """
+    _, rest_ss = _chunk_streams(seed_seq)
+    rng = np.random.default_rng(rest_ss)
+    keys = np.arange(first_key, first_key + size, dtype=np.int64)
+
+    tenure_months = np.clip(rng.exponential(scale=24, size=size).astype(np.int64), 1, 120)
+    tier_codes = rng.choice(4, size=size, p=SUBSCRIPTION_TIER_P)
+    monthly_charges = np.round(TIER_BASE_CHARGE[tier_codes] * rng.uniform(0.9, 1.1, size=size), 2)
+
+    login_frequency = generate_login_frequency(seed_seq, size)
+    feature_usage_pct = rng.beta(a=2, b=5, size=size) * 100
+    support_tickets_90d = rng.poisson(lam=2, size=size)
+    payment_delays_12m = rng.poisson(lam=0.5, size=size)
+    discount_count = rng.poisson(lam=1, size=size)
+    nps_score = rng.choice(11, size=size, p=NPS_P)
+    email_open_rate = rng.beta(a=3, b=4, size=size)
+    last_activity_days = rng.exponential(scale=7, size=size).astype(np.int64)
+
+    w = label_weights
+    churn_score = (
+        w["tenure_months"] * tenure_months +
+        w["login_frequency_monthly"] * login_frequency +
+        w["feature_usage_pct"] * feature_usage_pct +
+        w["support_tickets_90d"] * support_tickets_90d +
+        w["payment_delays_12m"] * payment_delays_12m +
+        w["nps_score"] * nps_score +
+        w["last_activity_days"] * last_activity_days +
+        rng.normal(0, noise_sigma, size)
+    )
+    churned = rng.binomial(1, 1 / (1 + np.exp(-churn_score)))
+
+    return pd.DataFrame({
+        'customer_id': customer_ids_from_keys(keys).astype(object) if string_ids else keys,
+        'tenure_months': tenure_months,
+        'subscription_tier': pd.Categorical.from_codes(tier_codes, categories=SUBSCRIPTION_TIERS),
+        'monthly_charges': monthly_charges,
+        'login_frequency_monthly': login_frequency,
+        'feature_usage_pct': np.round(feature_usage_pct, 1),
+        'support_tickets_90d': support_tickets_90d,
+        'payment_delays_12m': payment_delays_12m,
+        'discount_count': discount_count,
+        'nps_score': nps_score,
+        'email_open_rate': np.round(email_open_rate, 3),
+        'last_activity_days': last_activity_days,
+        'churned': churned,
+    }, copy=False)
+
+
+def write_generated_chunk(task: Tuple) -> Tuple[str, int]:
+    """Generate one chunk to out_dir/part-NNNNN.csv; returns (path, rows)."""
+    index, first_key, size, seed_seq, out_dir, string_ids, label_weights, noise_sigma = task
+    path = os.path.join(out_dir, f"part-{index:05d}.csv")
+    generate_customer_chunk(first_key, size, seed_seq, label_weights, noise_sigma,
+                            string_ids=string_ids).to_csv(path, index=False)
+    return path, size
+
+
+# Cross-validated model search: each worker receives the scaled fold matrices
+# and the base model parameters once (pool initializer), then only
+# (fold, params) tasks.
+_CV_FOLDS = None
+_CV_MODEL_PARAMS: Dict[str, Any] = {}
+
+
+def init_cv_worker(folds: List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]],
+                   model_params: Dict[str, Any]) -> None:
+    """Install the fold matrices and base LogisticRegression parameters in this process."""
+    global _CV_FOLDS, _CV_MODEL_PARAMS
+    _CV_FOLDS, _CV_MODEL_PARAMS = folds, dict(model_params)
+
+
+def fit_cv_candidate(task: Tuple[int, Dict[str, Any]]) -> Dict[str, Any]:
+    """Fit one candidate on one training fold and score it on the validation fold."""
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import log_loss, roc_auc_score
+
+    fold, params = task
+    X_tr, y_tr, X_va, y_va = _CV_FOLDS[fold]
+    start = time.perf_counter()
+    model = LogisticRegression(**{**_CV_MODEL_PARAMS, **params}).fit(X_tr, y_tr)
+    fit_seconds = time.perf_counter() - start
+    proba = model.predict_proba(X_va)[:, 1]
+    return {
+        **params,
+        'fold': fold,
+        'roc_auc': roc_auc_score(y_va, proba),
+        'log_loss': log_loss(y_va, proba),
+        'n_iter': int(np.max(model.n_iter_)),
+        'fit_seconds': fit_seconds,
+    }
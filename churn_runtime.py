@@ -0,0 +1,419 @@
+"""
+Churn runtime: NumPy-only loader and scoring for the exported model bundle.
+
+Imports nothing heavier than numpy, so serving containers start without
+scikit-learn, lifelines or pandas and never retrain. The notebook imports the
+same module for its days-until-churn engine and intervention rules, and the
+deployment package ships this file unchanged, so the two cannot drift.
+"""
+
+import json
+import math
+import os
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+BUNDLE_FORMAT_VERSION = 1
+RISK_TIER_LABELS = np.array(["Low", "Medium", "High", "Critical"], dtype=object)
+DEFAULT_INTERVENTION_WINDOW = {"window_start": 20, "window_optimal": 45, "window_end": 60, "source": "default"}
+NO_RISK_FACTORS = ("No major risk factors", "No major risk factors identified")
+
+
+def days_until_churn(
+    baseline_times: np.ndarray,
+    baseline_cumhaz: np.ndarray,
+    partial_hazard: Optional[np.ndarray],
+    churn_prob: np.ndarray,
+    min_days: int,
+    max_days: int,
+    max_matrix_elements: int = 4_000_000,
+) -> np.ndarray:
+    """
+    Predict days until churn from a Cox model without a dense survival matrix.
+
+    For customer i, S_i(t) = exp(-H0(t) * h_i). The personalized threshold is
+    0.5 + (p_i - 0.5) * 0.4 clipped to [0.3, 0.7]; higher churn risk means a
+    higher threshold and therefore an earlier crossing. Because H0 is
+    non-decreasing, the first t with S_i(t) <= threshold is a searchsorted on
+    H0. Customers whose curve never crosses fall back to the integral of S_i(t),
+    evaluated in chunks of at most `max_matrix_elements` (times x customers).
+    Without a Cox model (`partial_hazard` None) days scale with 1 - p.
+
+    Returns integer days clipped to [min_days, max_days].
+    """
+    prob = np.atleast_1d(np.asarray(churn_prob, dtype=float)).ravel()
+    if partial_hazard is None:
+        return np.clip(max_days * (1 - prob), min_days, max_days).astype(int)
+    times = np.asarray(baseline_times, dtype=float)
+    H0 = np.asarray(baseline_cumhaz, dtype=float)
+    h = np.atleast_1d(np.asarray(partial_hazard, dtype=float)).ravel()
+    n_times = len(times)
+
+    threshold = np.clip(0.5 + (prob - 0.5) * 0.4, 0.3, 0.7)
+
+    # S(t) <= thr  <=>  H0(t) >= -log(thr) / h
+    first = np.searchsorted(H0, -np.log(threshold) / h, side="left")
+    # Align exactly with exp(-H0*h) <= thr at the boundary (float rounding)
+    for _ in range(2):
+        prev = np.clip(first - 1, 0, max(n_times - 1, 0))
+        first = np.where((first > 0) & (np.exp(-H0[prev] * h) <= threshold), first - 1, first)
+        cur = np.clip(first, 0, max(n_times - 1, 0))
+        first = np.where((first < n_times) & (np.exp(-H0[cur] * h) > threshold), first + 1, first)
+
+    crossed = first < n_times
+    days = np.empty(len(h), dtype=float)
+    days[crossed] = times[first[crossed]]
+
+    # Never crosses within the model horizon: expected time ~ integral of S(t)
+    never = np.flatnonzero(~crossed)
+    if len(never) and n_times > 1:
+        dt = np.diff(times)[:, None]
+        chunk = max(1, max_matrix_elements // n_times)
+        for lo in range(0, len(never), chunk):
+            idx = never[lo:lo + chunk]
+            surv = np.exp(-np.outer(H0, h[idx]))
+            days[idx] = np.minimum(np.sum(dt * (surv[:-1] + surv[1:]) / 2, axis=0), max_days)
+    elif len(never):
+        days[never] = max_days * (1 - prob[never])
+    return np.clip(days, min_days, max_days).astype(int)
+
+
+def resolve_bundle_dir(path: str) -> str:
+    """Accept a bundle root (with a LATEST pointer) or a specific version dir."""
+    latest = os.path.join(path, "LATEST")
+    if os.path.exists(latest):
+        with open(latest) as f:
+            return os.path.join(path, f.read().strip())
+    return path
+
+
+class InferenceEngine:
+    """
+    Fused standardize + linear kernels for the churn and Cox models.
+
+    Standardization is folded into the weights once at load time,
+    ((x - mean) / scale) @ w == x @ (w / scale) - (mean / scale) @ w,
+    and both models share one (n_features, 2) weight matrix over the union
+    of their inputs, so scoring is a single dot product per row (or one
+    matmul per batch) with no scaler/model objects on the hot path.
+    """
+
+    def __init__(
+        self,
+        churn_features: Sequence[str],
+        churn_coef: np.ndarray,
+        churn_intercept: float,
+        churn_mean: np.ndarray,
+        churn_scale: np.ndarray,
+        cox_features: Optional[Sequence[str]] = None,
+        cox_params: Optional[np.ndarray] = None,
+        cox_norm_mean: Optional[np.ndarray] = None,
+        cox_mean: Optional[np.ndarray] = None,
+        cox_scale: Optional[np.ndarray] = None,
+    ):
+        self.has_survival = cox_params is not None
+        cox_features = list(cox_features or []) if self.has_survival else []
+        self.features: List[str] = list(dict.fromkeys(list(churn_features) + cox_features))
+        pos = {f: i for i, f in enumerate(self.features)}
+        self.churn_index = np.array([pos[f] for f in churn_features], dtype=np.intp)
+        self.cox_index = np.array([pos[f] for f in cox_features], dtype=np.intp)
+
+        W = np.zeros((len(self.features), 2))
+        b = np.zeros(2)
+        w = np.asarray(churn_coef, dtype=float) / np.asarray(churn_scale, dtype=float)
+        W[self.churn_index, 0] = w
+        b[0] = float(churn_intercept) - float(np.asarray(churn_mean, dtype=float) @ w)
+        if self.has_survival:
+            params = np.asarray(cox_params, dtype=float)
+            cox_scale = np.asarray(cox_scale, dtype=float)
+            W[self.cox_index, 1] = params / cox_scale
+            b[1] = -float((np.asarray(cox_mean, dtype=float) / cox_scale + np.asarray(cox_norm_mean, dtype=float)) @ params)
+        self.W = np.ascontiguousarray(W)
+        self.b = b
+        self.w_churn = np.ascontiguousarray(W[self.churn_index, 0])
+        self.w_cox = np.ascontiguousarray(W[self.cox_index, 1])
+
+    def vector(self, record: Mapping[str, Any]) -> np.ndarray:
+        """Feature vector (union order) from a customer record."""
+        return np.fromiter((float(record[f]) for f in self.features), dtype=float, count=len(self.features))
+
+    def matrix(self, columns: Mapping[str, np.ndarray], positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """Feature matrix (union order) from column arrays, optionally at row positions."""
+        if positions is None:
+            return np.column_stack([np.asarray(columns[f], dtype=float) for f in self.features])
+        return np.column_stack([np.asarray(columns[f], dtype=float)[positions] for f in self.features])
+
+    def score_one(self, x: np.ndarray) -> Tuple[float, float]:
+        """(churn probability, partial hazard) for one union-order feature vector."""
+        z_churn, z_cox = (x @ self.W + self.b).tolist()
+        prob = 1.0 / (1.0 + math.exp(-min(max(z_churn, -500.0), 500.0)))
+        return prob, (math.exp(z_cox) if self.has_survival else float("nan"))
+
+    def score_batch(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(churn probabilities, partial hazards) for rows of union-order features."""
+        Z = np.asarray(X, dtype=float) @ self.W + self.b
+        prob = 1.0 / (1.0 + np.exp(-np.clip(Z[:, 0], -500.0, 500.0)))
+        hazard = np.exp(Z[:, 1]) if self.has_survival else np.full(len(Z), np.nan)
+        return prob, hazard
+
+    def churn_probability(self, X: np.ndarray) -> np.ndarray:
+        """P(churn) for rows of raw churn features (churn feature order)."""
+        z = np.asarray(X, dtype=float) @ self.w_churn + self.b[0]
+        return 1.0 / (1.0 + np.exp(-np.clip(z, -500.0, 500.0)))
+
+    def partial_hazard(self, X: np.ndarray) -> np.ndarray:
+        """Cox partial hazard exp(x·β) for rows of raw Cox features (Cox feature order)."""
+        return np.exp(np.asarray(X, dtype=float) @ self.w_cox + self.b[1])
+
+
+class ModelBundle:
+    """Flat NumPy view of the trained churn and survival artifacts."""
+
+    def __init__(self, bundle_dir: str, manifest: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        self.bundle_dir = bundle_dir
+        self.manifest = manifest
+        self.arrays = arrays
+        self.version: str = manifest["bundle_version"]
+        self.churn_features: List[str] = manifest["churn_features"]
+        self.cox_features: List[str] = manifest["cox_features"]
+        self.channels: List[str] = manifest["channels"]
+        survival = {}
+        if self.has_survival:
+            survival = dict(
+                cox_features=self.cox_features,
+                cox_params=arrays["cox_params"],
+                cox_norm_mean=arrays["cox_norm_mean"],
+                cox_mean=arrays["cox_scaler_mean"],
+                cox_scale=arrays["cox_scaler_scale"],
+            )
+        self.engine = InferenceEngine(
+            self.churn_features,
+            arrays["churn_coef"],
+            float(arrays["churn_intercept"][0]),
+            arrays["churn_scaler_mean"],
+            arrays["churn_scaler_scale"],
+            **survival,
+        )
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    @property
+    def has_survival(self) -> bool:
+        return "cox_params" in self.arrays
+
+    def channel_effectiveness(self) -> Dict[str, Dict[str, float]]:
+        return {
+            ch: {
+                "lift": float(self.arrays["channel_lift"][i]),
+                "abs_reduction": float(self.arrays["channel_abs_reduction"][i]),
+                "roi": float(self.arrays["channel_roi"][i]),
+                "cost": float(self.arrays["channel_cost"][i]),
+            }
+            for i, ch in enumerate(self.channels)
+        }
+
+    def churn_probability(self, X: np.ndarray) -> np.ndarray:
+        """P(churn) for rows of raw churn features."""
+        return self.engine.churn_probability(np.atleast_2d(X))
+
+    def partial_hazard(self, X: np.ndarray) -> np.ndarray:
+        """Cox partial hazard exp(x·β) for rows of raw Cox features."""
+        return self.engine.partial_hazard(np.atleast_2d(X))
+
+    def risk_tier(self, prob: np.ndarray) -> np.ndarray:
+        c = self.manifest["risk_cutoffs"]
+        edges = np.array([c["medium"], c["high"], c["critical"]], dtype=float)
+        return RISK_TIER_LABELS[np.searchsorted(edges, np.asarray(prob, dtype=float), side="right")]
+
+    def predict_days(self, churn_prob: np.ndarray, partial_hazard: Optional[np.ndarray]) -> np.ndarray:
+        """First crossing of the personalized survival threshold (days_until_churn)."""
+        surv = self.manifest["survival"]
+        if not self.has_survival:
+            partial_hazard = None
+        times = self["cox_baseline_times"] if self.has_survival else None
+        cumhaz = self["cox_baseline_cumhaz"] if self.has_survival else None
+        return days_until_churn(times, cumhaz, partial_hazard, churn_prob,
+                                surv["min_duration_days"], surv["max_prediction_days"])
+
+
+def load_model_bundle(path: str, mmap: bool = True) -> ModelBundle:
+    """Load a bundle root or version directory; arrays are memory-mapped."""
+    bundle_dir = resolve_bundle_dir(path)
+    with open(os.path.join(bundle_dir, "manifest.json")) as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported bundle format: {manifest.get('format_version')}")
+    arrays = {
+        name: np.load(os.path.join(bundle_dir, fname), mmap_mode="r" if mmap else None, allow_pickle=False)
+        for name, fname in manifest["arrays"].items()
+    }
+    return ModelBundle(bundle_dir, manifest, arrays)
+
+
+class CustomerColumns:
+    """Read-only, memory-mapped customer records from the notebook's columnar store."""
+
+    def __init__(self, store_dir: str):
+        with open(os.path.join(store_dir, "manifest.json")) as f:
+            self.manifest = json.load(f)
+        self.columns: Dict[str, np.ndarray] = {}
+        for entry in self.manifest["columns"]:
+            values = np.load(os.path.join(store_dir, entry["file"]), mmap_mode="r", allow_pickle=False)
+            if entry["kind"] == "categorical":
+                values = np.append(np.array(entry["categories"], dtype=object), None)[values]
+            elif "missing_file" in entry:
+                values = values.astype(object)
+                values[np.load(os.path.join(store_dir, entry["missing_file"]), allow_pickle=False)] = None
+            self.columns[entry["name"]] = values
+        ids = self.columns["customer_id"]
+        self.index = {str(cid): i for i, cid in reversed(list(enumerate(ids)))}
+
+    def record(self, customer_id: str) -> Optional[Dict[str, Any]]:
+        pos = self.index.get(customer_id)
+        if pos is None:
+            return None
+        return {
+            col: (arr[pos].item() if isinstance(arr[pos], np.generic) else arr[pos])
+            for col, arr in self.columns.items()
+        }
+
+
+def standard_risk_factors(record: Mapping[str, Any], feature_thresholds: Mapping[str, float],
+                          inactivity_label: str) -> List[str]:
+    """Standardized risk factors of a customer record, in the order the channel mappings use."""
+    ft = feature_thresholds
+    rules = [
+        ("Payment issues detected", int(record.get("has_payment_issues", 0)) == 1),
+        ("Multiple payment delays", int(record.get("payment_delays_12m", 0)) > ft["payment_delays_high"]),
+        ("High support ticket volume", int(record.get("is_heavy_support_user", 0)) == 1),
+        (inactivity_label, int(record.get("is_inactive", 0)) == 1),
+        ("Low NPS score", float(record.get("nps_score", 10)) < ft["nps_low"]),
+        ("Low engagement", float(record.get("engagement_score", 100)) < ft["engagement_low"]),
+    ]
+    return [label for label, hit in rules if hit]
+
+
+def risk_factors(record: Mapping[str, Any], manifest: Mapping[str, Any]) -> List[str]:
+    """standard_risk_factors with the thresholds stored in a bundle manifest."""
+    return standard_risk_factors(record, manifest["feature_thresholds"], manifest["inactivity_label"])
+
+
+def score_record(bundle: ModelBundle, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Churn probability, tier and survival timing for one customer record."""
+    prob, hazard = bundle.engine.score_one(bundle.engine.vector(record))
+    probs = np.array([prob])
+    days = bundle.predict_days(probs, np.array([hazard]) if bundle.has_survival else None)
+    return {
+        "churn_probability": prob,
+        "risk_tier": str(bundle.risk_tier(probs)[0]),
+        "predicted_days_until_churn": int(days[0]),
+    }
+
+
+def intervention_rules(
+    churn_probability: float,
+    predicted_days_until_churn: Optional[int],
+    factors: Optional[List[str]],
+    tier: str,
+    clv: float,
+    window: Optional[Mapping[str, Any]],
+    channel_effectiveness: Mapping[str, Mapping[str, float]],
+    risk_cutoffs: Mapping[str, float],
+    feature_thresholds: Mapping[str, float],
+    risk_factor_channel: Mapping[str, str],
+    risk_factor_action: Mapping[str, str],
+    tier_lift_multiplier: Mapping[str, float],
+) -> Dict[str, Any]:
+    """
+    Timing, channel, action, priority and expected impact of one intervention.
+
+    The single definition behind the notebook's recommend_intervention tool and
+    the deployed agent's `recommend`; callers add customer_id / channel_source.
+    """
+    win = window or DEFAULT_INTERVENTION_WINDOW
+    start, end = int(win.get("window_start", 20)), int(win.get("window_end", 60))
+    optimal = int(win.get("window_optimal", (start + end) // 2))
+
+    timing_bucket, sched_start, sched_end = "unknown", None, None
+    if predicted_days_until_churn is not None:
+        pdays = int(predicted_days_until_churn)
+        timing_bucket = "too_late" if pdays < start else "optimal" if pdays <= end else "too_early"
+        sched_start, sched_end = max(0, pdays - end), max(0, pdays - start)
+
+    ft, cut = feature_thresholds, risk_cutoffs
+    is_high_value = tier in ["Premium", "Enterprise"] or clv > ft["high_value_clv"]
+
+    # Default channel by customer value, overridden by the primary risk factor
+    channel = "Call" if is_high_value else "Email"
+    action = "Proactive retention outreach"
+    factors = factors or []
+    if factors and factors[0] not in NO_RISK_FACTORS:
+        channel = risk_factor_channel.get(factors[0], channel)
+        action = risk_factor_action.get(factors[0], "Targeted retention outreach")
+    # Escalate to Combined for critical cases
+    if churn_probability >= cut["critical"] and (is_high_value or len(factors) > 2):
+        channel, action = "Combined", "Multi-channel urgent retention campaign"
+
+    effect = channel_effectiveness[channel]
+    expected_lift = effect["lift"] * tier_lift_multiplier.get(tier, 1.0)
+    value_at_risk = clv * churn_probability
+    value_saved = value_at_risk * expected_lift
+
+    if churn_probability >= cut["critical"] and clv > ft["high_value_clv"]:
+        priority = 1  # Critical - immediate action
+    elif churn_probability >= cut["high"] or clv > ft["mid_value_clv"]:
+        priority = 2  # High - action within 24h
+    elif churn_probability >= cut["medium"]:
+        priority = 3  # Medium - action within week
+    else:
+        priority = 4  # Low - scheduled outreach
+
+    return {
+        "predicted_days_until_churn": predicted_days_until_churn,
+        "timing_bucket": timing_bucket,
+        "intervention_window": {
+            "window_start_days": start,
+            "window_optimal_days": optimal,
+            "window_end_days": end,
+            "source": str(win.get("source", "default")),
+        },
+        "recommended_outreach_schedule": {"start_in_days": sched_start, "end_in_days": sched_end},
+        "intervention_channel": channel,
+        "intervention_action": action,
+        "priority": priority,
+        "priority_label": {1: "Critical", 2: "High", 3: "Medium", 4: "Low"}[priority],
+        "expected_lift": round(expected_lift, 3),
+        "intervention_cost": round(effect["cost"], 2),
+        "roi_estimate": round(value_saved / max(effect["cost"], 1), 1),
+        "value_at_risk": round(value_at_risk, 2),
+        "value_if_saved": round(value_saved, 2),
+        "risk_factors_addressed": factors[:3],
+    }
+
+
+def recommend(
+    bundle: ModelBundle,
+    record: Dict[str, Any],
+    churn_probability: float,
+    predicted_days_until_churn: Optional[int],
+    factors: List[str],
+) -> Dict[str, Any]:
+    """intervention_rules with the cutoffs, mappings and channel effects stored in the bundle."""
+    m = bundle.manifest
+    return {
+        **intervention_rules(
+            churn_probability, predicted_days_until_churn, factors,
+            tier=str(record.get("subscription_tier", "Standard")),
+            clv=float(record.get("clv_estimate", 0.0)),
+            window=m["intervention_window"],
+            channel_effectiveness=bundle.channel_effectiveness(),
+            risk_cutoffs=m["risk_cutoffs"],
+            feature_thresholds=m["feature_thresholds"],
+            risk_factor_channel=m["risk_factor_channel"],
+            risk_factor_action=m["risk_factor_action"],
+            tier_lift_multiplier=m["tier_lift_multiplier"],
+        ),
+        "channel_source": f"A/B Test Results (bundle {bundle.version})",
+    }